@@ -9,30 +9,55 @@ Tool to search for application crashes in Windows Event Log.
 # IMPORTS
 # ============================================================================
 import sys
-import win32evtlog
-import win32con
-import pywintypes
 from difflib import SequenceMatcher
-from datetime import datetime, timedelta
+from datetime import timezone
 import os
+import re
+import functools
+from pathlib import PurePath
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional accelerators - fall back to the standard library when missing
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = process = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QComboBox,
-    QTextEdit, QFileDialog, QMessageBox, QFrame, QStyle, QStyleOptionComboBox,
+    QPlainTextEdit, QFileDialog, QMessageBox, QFrame, QStyle, QStyleOptionComboBox,
     QStyleOptionButton, QProxyStyle
 )
-from PyQt6.QtCore import Qt, QRect
-from PyQt6.QtGui import QFont, QIcon, QClipboard, QPixmap, QPainter, QColor, QPen, QPolygon
+from PyQt6.QtCore import Qt, QRect, QThread, QTimer, pyqtSignal
+from PyQt6.QtGui import QFont, QIcon, QClipboard, QPixmap, QPainter, QPainterPath, QColor, QPen, QPolygon
 
 
 # ============================================================================
 # CUSTOM STYLE FOR BETTER CHECKBOX AND COMBOBOX RENDERING
 # ============================================================================
 
+def _polyline_path(*points):
+    """Build a QPainterPath through the given (x, y) points."""
+    path = QPainterPath()
+    path.moveTo(*points[0])
+    for point in points[1:]:
+        path.lineTo(*point)
+    return path
+
+
 class CustomStyle(QProxyStyle):
     """Custom style that draws proper checkmarks and dropdown arrows."""
     
+    # Checkmark and V arrow shapes, relative to the indicator center
+    CHECK_PATH = _polyline_path((-4, 0), (-1, 3), (4, -3))
+    ARROW_PATH = _polyline_path((-4, -2), (0, 2), (4, -2))
+    
     def drawPrimitive(self, element, option, painter, widget=None):
         """Draw primitive elements with custom appearance."""
         if element == QStyle.PrimitiveElement.PE_IndicatorCheckBox:
@@ -56,10 +81,7 @@ class CustomStyle(QProxyStyle):
             if option.state & QStyle.StateFlag.State_On:
                 painter.setPen(QPen(QColor("#ffffff"), 2, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin))
                 # Draw checkmark path
-                cx = rect.center().x()
-                cy = rect.center().y()
-                painter.drawLine(cx - 4, cy, cx - 1, cy + 3)
-                painter.drawLine(cx - 1, cy + 3, cx + 4, cy - 3)
+                self._draw_path(painter, self.CHECK_PATH, rect.center())
             return
         
         if element == QStyle.PrimitiveElement.PE_IndicatorArrowDown:
@@ -68,12 +90,8 @@ class CustomStyle(QProxyStyle):
             painter.setRenderHint(QPainter.RenderHint.Antialiasing)
             painter.setPen(QPen(QColor("#cdd6f4"), 2))
             
-            cx = rect.center().x()
-            cy = rect.center().y()
-            
             # Draw V shape arrow
-            painter.drawLine(cx - 4, cy - 2, cx, cy + 2)
-            painter.drawLine(cx, cy + 2, cx + 4, cy - 2)
+            self._draw_path(painter, self.ARROW_PATH, rect.center())
             return
         
         super().drawPrimitive(element, option, painter, widget)
@@ -89,24 +107,28 @@ class CustomStyle(QProxyStyle):
             painter.setRenderHint(QPainter.RenderHint.Antialiasing)
             painter.setPen(QPen(QColor("#cdd6f4"), 2))
             
-            cx = arrow_rect.center().x()
-            cy = arrow_rect.center().y()
-            
             # Draw V shape arrow
-            painter.drawLine(cx - 4, cy - 2, cx, cy + 2)
-            painter.drawLine(cx, cy + 2, cx + 4, cy - 2)
+            self._draw_path(painter, self.ARROW_PATH, arrow_rect.center())
             return
         
         super().drawComplexControl(control, option, painter, widget)
+    
+    def _draw_path(self, painter, path, center):
+        """Stroke a prebuilt shape path centered on a point, without filling it."""
+        painter.save()
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.translate(center)
+        painter.drawPath(path)
+        painter.restore()
 
 
 # ============================================================================
 # CONSTANTS
 # ============================================================================
 
-# Days options for dropdown
-DAYS_OPTIONS = ['2 days', '3 days', '7 days', '14 days']
-DAYS_MAP = {'2 days': 2, '3 days': 3, '7 days': 7, '14 days': 14}
+# Days options for dropdown: (label, number of days)
+# The number of days is stored as the item data of each entry
+DAYS_OPTIONS = [('2 days', 2), ('3 days', 3), ('7 days', 7), ('14 days', 14)]
 
 # Application version
 APP_VERSION = "1.0.1"
@@ -118,6 +140,34 @@ APP_TITLE = "Crash Detective"
 # 1002 = Application Hang
 APPLICATION_ERROR_EVENT_IDS = [1000, 1001, 1002]
 
+# Event Log API (winevt) rendering
+# Number of event handles requested per EvtNext call
+# Crash events are ~2 KiB each, so 512 keeps a batch under ~1 MiB of RPC data
+EVT_BATCH_SIZE = 512
+# Milliseconds to wait for each EvtNext batch (-1 = INFINITE)
+# A slow batch must not abort the scan; cancellation is checked between batches
+EVT_NEXT_TIMEOUT = -1
+# Indexes into the EvtRenderContextSystem value array (EVT_SYSTEM_PROPERTY_ID)
+EVT_SYSTEM_PROVIDER_NAME = 0
+EVT_SYSTEM_EVENT_ID = 2
+EVT_SYSTEM_TIME_CREATED = 8
+# EVT_VARIANT types that need special handling when building the message
+EVT_VAR_TYPE_BINARY = 14
+EVT_VAR_TYPE_HEX_INT32 = 20
+EVT_VAR_TYPE_HEX_INT64 = 21
+# Delay after the last edit of the exe path before auto-searching
+AUTO_SEARCH_DELAY_MS = 400
+# Number of events read between search progress updates
+PROGRESS_INTERVAL = 256
+# Event levels reported as errors: Critical (1) and Error (2), the levels
+# the legacy API maps to EVENTLOG_ERROR_TYPE
+EVT_ERROR_LEVELS = (1, 2)
+
+# Error shown when reading an event log fails with ERROR_ACCESS_DENIED (5)
+ACCESS_DENIED_MSG = "❌ Access denied. Please run as Administrator."
+# Error shown when the pywin32 Event Log API cannot be imported
+PYWIN32_MISSING_MSG = "❌ pywin32 is not installed. Install it with: pip install pywin32"
+
 # Common binary folder names in games
 # These folders typically contain the .exe but are not the "root" game folder
 BINARY_FOLDER_PATTERNS = [
@@ -128,6 +178,24 @@ BINARY_FOLDER_PATTERNS = [
     'engine', 'runtime', 'launcher',
 ]
 
+# Matches a binary folder pattern as a word of the folder name. A word
+# starts after a non-letter or at a CamelCase hump, and may carry a digit
+# suffix or run into the next word or pattern (e.g. "Bin64", "bin32",
+# "x64_Release", "Win64Shipping", "GameBinaries", "binx64"), so names like
+# "Outlast" don't match "out". Only the patterns are case-insensitive: the
+# word boundaries rely on letter case.
+_BINARY_FOLDER_ALTERNATION = '(?i:' + '|'.join(map(re.escape, BINARY_FOLDER_PATTERNS)) + ')'
+BINARY_FOLDER_RE = re.compile(
+    r'(?:(?<![A-Za-z])|(?<=[a-z])(?=[A-Z]))'
+    + _BINARY_FOLDER_ALTERNATION
+    + r'\d*(?=$|[^a-z]|' + _BINARY_FOLDER_ALTERNATION + ')'
+)
+
+# Folders too generic to be reported as a game's root folder
+GENERIC_FOLDERS = frozenset([
+    'games', 'program files', 'program files (x86)', 'steam', 'steamapps', 'common', 'users', ''
+])
+
 # Crash code translations - User-friendly error interpretations
 # Keys are patterns to search for (case-insensitive)
 # Values are human-readable explanations
@@ -306,8 +374,20 @@ CRASH_TRANSLATIONS = {
     'mswsock.dll': 'NETWORK ERROR: Windows socket provider crash.',
 }
 
+# Crash report header and section separator
+REPORT_BANNER = (
+    "╔══════════════════════════════════════════════════════════════╗\n"
+    "║                    CRASH DETECTIVE                              ║\n"
+    "╚══════════════════════════════════════════════════════════════╝\n"
+    "\n"
+)
+REPORT_SEPARATOR = "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+
+# Application icon shipped next to the script (or bundled by PyInstaller)
+ICON_FILENAME = "icon.ico"
+
 # Windows Event Log 1000 format labels for crash detail display
-DETAIL_LABELS = [
+DETAIL_LABELS = (
     "Faulting application name",
     "Application version",
     "Application timestamp",
@@ -321,7 +401,9 @@ DETAIL_LABELS = [
     "Faulting application path",
     "Faulting module path",
     "Report ID"
-]
+)
+# Report line prefix for each crash detail field, built once
+DETAIL_LINE_PREFIXES = tuple(f"      • {label}: " for label in DETAIL_LABELS)
 
 # Dark theme stylesheet
 DARK_STYLESHEET = """
@@ -406,7 +488,7 @@ QCheckBox {
     font-size: 13px;
     spacing: 10px;
 }
-QTextEdit {
+QPlainTextEdit {
     background-color: #11111b;
     border: 1px solid #45475a;
     border-radius: 4px;
@@ -446,317 +528,592 @@ def get_game_root_folder(exe_path):
                game_root_path is the full path to the game's root folder
                game_folder_name is just the folder name
     """
-    exe_dir = os.path.dirname(os.path.abspath(exe_path))
+    exe_dir = PurePath(os.path.abspath(exe_path)).parent
     current_path = exe_dir
     
-    # Keep track of how many levels we've gone up (limit to prevent going too high)
+    # Go up at most 4 levels (limit to prevent going too high)
     max_levels = 4
-    levels_up = 0
     
-    while levels_up < max_levels:
-        folder_name = os.path.basename(current_path)
-        folder_name_lower = folder_name.lower()
-        
-        # Check if current folder is a binary folder pattern
-        is_binary_folder = False
-        for pattern in BINARY_FOLDER_PATTERNS:
-            if pattern in folder_name_lower:
-                is_binary_folder = True
-                break
+    for _ in range(max_levels):
+        # This folder doesn't match binary patterns, consider it the game root
+        if not BINARY_FOLDER_RE.search(current_path.name):
+            break
         
-        if is_binary_folder:
-            # Go up one level
-            parent = os.path.dirname(current_path)
-            if parent == current_path:  # Reached root
-                break
-            current_path = parent
-            levels_up += 1
-        else:
-            # This folder doesn't match binary patterns, consider it the game root
+        # Go up one level
+        parent = current_path.parent
+        if parent == current_path:  # Reached root
             break
+        current_path = parent
     
     # Safety check: don't return drive root or common folders
-    folder_name = os.path.basename(current_path)
-    folder_name_lower = folder_name.lower()
-    
-    # Avoid returning too generic folders
-    generic_folders = ['games', 'program files', 'program files (x86)', 'steam', 'steamapps', 'common', 'users', '']
-    if folder_name_lower in generic_folders:
+    if current_path.name.lower() in GENERIC_FOLDERS:
         # Return the original exe directory instead
-        return exe_dir, os.path.basename(exe_dir)
+        return str(exe_dir), exe_dir.name
     
-    return current_path, folder_name
+    return str(current_path), current_path.name
 
 
 # ============================================================================
 # EVENT LOG READING
 # ============================================================================
 
-def read_application_logs(days):
+# pywin32 modules are loaded by _load_event_log_api when the first query
+# starts, so the window can be shown before the Event Log API is loaded.
+# Per-event helpers use these globals instead of importing on every call.
+_win32evtlog = None
+_pywintypes = None
+
+# (System, EventData) render contexts, created once and reused for every event
+_render_contexts = None
+
+
+def _load_event_log_api():
+    """
+    Import pywin32's Event Log API and create the render contexts, once.
+    
+    Rendering with EvtRenderEventValues returns the typed values directly,
+    which avoids building and parsing the event XML for every event.
+    
+    Returns:
+        The win32evtlog module
+    """
+    global _win32evtlog, _pywintypes, _render_contexts
+    if _win32evtlog is None:
+        import win32evtlog
+        import pywintypes
+        
+        # Set first, so callers can catch pywintypes.error from the contexts
+        _pywintypes = pywintypes
+        _render_contexts = (
+            win32evtlog.EvtCreateRenderContext(win32evtlog.EvtRenderContextSystem),
+            win32evtlog.EvtCreateRenderContext(win32evtlog.EvtRenderContextUser),
+        )
+        _win32evtlog = win32evtlog
+    return _win32evtlog
+
+
+def _query_events(channel, query, is_cancelled=None):
     """
-    Read Windows Application Event Logs for crash events.
+    Iterate the events of a log channel matching an XPath query, newest first.
+    
+    Each handle is closed once the caller moves on to the next event, so it
+    must be rendered inside the loop body.
+    
+    Args:
+        channel: Event log channel name (e.g. "Application")
+        query: XPath query string ("*" for all events)
+        is_cancelled: Optional callable, checked between batches, to stop early
+        
+    Yields:
+        Event handles, to be rendered with _render_system_values and
+        _render_user_values
+    """
+    win32evtlog = _load_event_log_api()
+    
+    flags = win32evtlog.EvtQueryChannelPath | win32evtlog.EvtQueryReverseDirection
+    query_handle = win32evtlog.EvtQuery(channel, flags, query)
+    
+    try:
+        while is_cancelled is None or not is_cancelled():
+            # Fetch a whole batch of handles per RPC round-trip
+            events = win32evtlog.EvtNext(query_handle, EVT_BATCH_SIZE, EVT_NEXT_TIMEOUT)
+            
+            if not events:
+                break
+            
+            for event in events:
+                try:
+                    yield event
+                finally:
+                    # Release each handle right away instead of holding the whole batch
+                    event.Close()
+    finally:
+        query_handle.Close()
+
+
+def _render_system_values(event):
+    """Render the System properties of an event, indexed by EVT_SYSTEM_* constants."""
+    return _win32evtlog.EvtRender(event, _win32evtlog.EvtRenderEventValues, Context=_render_contexts[0])
+
+
+def _render_user_values(event):
+    """Render the EventData/UserData values of an event as (value, type) pairs."""
+    return _win32evtlog.EvtRender(event, _win32evtlog.EvtRenderEventValues, Context=_render_contexts[1])
+
+
+def _build_event_query(days, event_ids=None):
+    """
+    Build an XPath query for error and critical events from the last N days.
+    
+    Filtering in the query lets the Event Log service discard unrelated
+    events before they are marshalled into the process.
     
     Args:
         days: Number of days to look back for events
+        event_ids: Optional list of Event IDs to restrict the query to
         
     Returns:
-        tuple: (list of log entries, error message or None)
-        Each log entry is a dict with keys:
-            - timestamp: datetime object
+        str: XPath query string for EvtQuery
+    """
+    conditions = [
+        "(" + " or ".join(f"Level={level}" for level in EVT_ERROR_LEVELS) + ")",
+        f"TimeCreated[timediff(@SystemTime) <= {days * 86400000}]",
+    ]
+    if event_ids:
+        conditions.append("(" + " or ".join(f"EventID={event_id}" for event_id in event_ids) + ")")
+    
+    return f"*[System[{' and '.join(conditions)}]]"
+
+
+def format_event_time(value):
+    """
+    Format an Event Log UTC timestamp as a local time string for the report.
+    
+    Readers keep the timestamp exactly as rendered by the Event Log API, so
+    the local time conversion is only paid for events that are displayed.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone().strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _split_event_data(user_values):
+    """
+    Build the message string and pick out the binary data from EventData values.
+    
+    Args:
+        user_values: (value, type) pairs rendered with the user context
+        
+    Returns:
+        tuple: (message, binary_data)
+               message joins the inserts with " | " like the legacy StringInserts
+               binary_data is the undecoded binary value, or None; decode it
+               with _decode_raw_data only for events that are kept
+    """
+    inserts = []
+    binary_data = None
+    
+    for value, value_type in user_values:
+        # Only missing and empty values are skipped, like empty legacy
+        # StringInserts; 0 and False are kept so field positions don't shift
+        if value is None or value == "":
+            continue
+        if value_type == EVT_VAR_TYPE_BINARY:
+            binary_data = value
+        elif value_type == EVT_VAR_TYPE_HEX_INT32:
+            inserts.append(f"0x{value:08x}")
+        elif value_type == EVT_VAR_TYPE_HEX_INT64:
+            inserts.append(f"0x{value:016x}")
+        else:
+            inserts.append(str(value))
+    
+    return " | ".join(inserts), binary_data
+
+
+def _decode_raw_data(binary_data):
+    """
+    Decode the binary data of an event for display.
+    
+    Args:
+        binary_data: Binary value returned by _split_event_data, or None
+        
+    Returns:
+        str: The data decoded as UTF-8 (undecodable bytes dropped), or ""
+    """
+    if not binary_data:
+        return ""
+    return bytes(binary_data).decode('utf-8', errors='ignore')
+
+
+@functools.lru_cache(maxsize=256)
+def _get_publisher_metadata(provider_name):
+    """
+    Open the publisher metadata for a provider, once per provider.
+    
+    Returns:
+        Publisher metadata handle, or None if the provider has no metadata
+    """
+    try:
+        return _win32evtlog.EvtOpenPublisherMetadata(provider_name)
+    except _pywintypes.error:
+        return None
+
+
+def _format_event_message(provider_name, event):
+    """
+    Format the event description using the provider's message table.
+    
+    Used only for events without EventData inserts.
+    
+    Returns:
+        str: The formatted message, or "" if it cannot be formatted
+    """
+    metadata = _get_publisher_metadata(provider_name)
+    if metadata is None:
+        return ""
+    
+    try:
+        return _win32evtlog.EvtFormatMessage(metadata, event, _win32evtlog.EvtFormatMessageEvent) or ""
+    except _pywintypes.error:
+        return ""
+
+
+def iter_application_logs(days, errors, is_cancelled=None, progress=None):
+    """
+    Read Windows Application Event Logs for crash events, one at a time.
+    
+    Entries are yielded as they are read, so the caller can filter them
+    without holding every event in memory.
+    
+    Args:
+        days: Number of days to look back for events
+        errors: List that receives an error message if reading fails
+        is_cancelled: Optional callable returning True to stop reading early
+        progress: Optional callable receiving the number of events read so far
+        
+    Yields:
+        dict: A log entry with keys:
+            - timestamp: event time as a UTC datetime
             - source: event source name
             - event_id: event ID number
             - message: event message/description
-            - raw_data: additional data from the event
+            - binary_data: undecoded binary data of the event, or None;
+              decode it with _decode_raw_data only for kept events
+            - source_lower, message_lower: lowercased source and message
+            - message_norm: message_lower with '/' path separators
     """
-    logs = []
+    count = 0
     error_msg = None
     
-    # Calculate time threshold
-    time_threshold = datetime.now() - timedelta(days=days)
+    # Time, level and Event ID filters are applied by the Event Log service
+    query = _build_event_query(days, APPLICATION_ERROR_EVENT_IDS)
     
     try:
-        # Open the Application event log
-        hand = win32evtlog.OpenEventLog(None, "Application")
+        _load_event_log_api()
         
-        if not hand:
-            return [], "Failed to open Application Event Log"
-        
-        try:
-            flags = win32evtlog.EVENTLOG_BACKWARDS_READ | win32evtlog.EVENTLOG_SEQUENTIAL_READ
+        for event in _query_events("Application", query, is_cancelled):
+            system_values = _render_system_values(event)
+            user_values = _render_user_values(event)
+            event_time = system_values[EVT_SYSTEM_TIME_CREATED][0]
+            event_id = system_values[EVT_SYSTEM_EVENT_ID][0]
+            # Provider and module names repeat across thousands of events;
+            # interning keeps a single string object for each distinct name
+            source = sys.intern(system_values[EVT_SYSTEM_PROVIDER_NAME][0] or "Unknown")
             
-            event_time = None  # Track last event time for threshold check
-            while True:
-                events = win32evtlog.ReadEventLog(hand, flags, 0)
-                
-                if not events:
-                    break
-                
-                for event in events:
-                    # Get event timestamp
-                    event_time = event.TimeGenerated
-                    
-                    # Convert pywintypes.datetime to Python datetime if needed
-                    if hasattr(event_time, 'Format'):
-                        event_time = datetime(
-                            event_time.year,
-                            event_time.month,
-                            event_time.day,
-                            event_time.hour,
-                            event_time.minute,
-                            event_time.second
-                        )
-                    
-                    # Skip if event is older than threshold
-                    # Use continue instead of break — events may not be strictly ordered
-                    if event_time < time_threshold:
-                        continue
-                    
-                    # Filter by event type (Error = 1)
-                    event_type = event.EventType
-                    if event_type != win32con.EVENTLOG_ERROR_TYPE:
-                        continue
-                    
-                    # Get Event ID (mask to get actual ID)
-                    event_id = event.EventID & 0xFFFF
-                    
-                    # Filter by specific crash-related Event IDs
-                    if event_id not in APPLICATION_ERROR_EVENT_IDS:
-                        continue
-                    
-                    # Extract event message
-                    message = ""
-                    if event.StringInserts:
-                        message = " | ".join([str(s) for s in event.StringInserts if s])
-                    
-                    # Get additional data
-                    raw_data = ""
-                    if event.Data:
-                        try:
-                            raw_data = event.Data.decode('utf-8', errors='ignore')
-                        except (UnicodeDecodeError, AttributeError):
-                            raw_data = str(event.Data)
-                    
-                    log_entry = {
-                        'timestamp': event_time,
-                        'source': event.SourceName or "Unknown",
-                        'event_id': event_id,
-                        'message': message,
-                        'raw_data': raw_data
-                    }
-                    logs.append(log_entry)
-                
-                # Check if we've gone past the time threshold
-                if event_time is not None and event_time < time_threshold:
-                    break
-                    
-        finally:
-            win32evtlog.CloseEventLog(hand)
+            # Extract event message and additional data
+            message, binary_data = _split_event_data(user_values)
+            if not message:
+                message = _format_event_message(source, event)
+            
+            # Lowercased/normalized forms are computed once here, not on
+            # every matching check
+            message_lower = message.lower()
             
+            log_entry = {
+                'timestamp': event_time,
+                'source': source,
+                'source_lower': sys.intern(source.lower()),
+                'event_id': event_id,
+                'message': message,
+                'message_lower': message_lower,
+                'message_norm': message_lower.replace('\\', '/'),
+                'binary_data': binary_data
+            }
+            yield log_entry
+            
+            count += 1
+            if progress is not None and count % PROGRESS_INTERVAL == 0:
+                progress(count)
+            
+    except ImportError:
+        error_msg = PYWIN32_MISSING_MSG
     except PermissionError:
-        error_msg = "❌ Access denied. Please run as Administrator."
-    except pywintypes.error as e:
+        error_msg = ACCESS_DENIED_MSG
+    except _pywintypes.error as e:
         # Handle Windows-specific errors
         error_code = e.args[0] if e.args else 0
         if error_code == 5:  # Access denied
-            error_msg = "❌ Access denied. Please run as Administrator."
+            error_msg = ACCESS_DENIED_MSG
         else:
             error_msg = f"❌ Windows Error: {str(e)}"
     except Exception as e:
         error_msg = f"❌ Error reading Event Log: {str(e)}"
     
-    return logs, error_msg
+    if error_msg:
+        errors.append(error_msg)
+
+
+def _scan_general_log(log_name, query, needle_re, max_results, is_cancelled):
+    """
+    Scan one event log for error events that mention the game folder or path.
+    
+    Args:
+        log_name: Event log channel to scan ("Application" or "System")
+        query: XPath query selecting the events to scan
+        needle_re: Compiled regex matching the game folder name or root path
+                   in a lowercased message with '/' separators
+        max_results: Stop after this many related events
+        is_cancelled: Optional callable returning True to stop reading early
+        
+    Returns:
+        tuple: (list of log entries, error message or None)
+    """
+    logs = []
+    
+    try:
+        _load_event_log_api()
+        
+        for event in _query_events(log_name, query, is_cancelled):
+            # Extract event message and additional data
+            message, binary_data = _split_event_data(_render_user_values(event))
+            
+            message_lower = message.lower()
+            message_norm = message_lower.replace('\\', '/')
+            
+            # Check if message mentions game folder or path
+            if not needle_re.search(message_norm):
+                continue
+            
+            # System properties are only rendered for related events
+            system_values = _render_system_values(event)
+            
+            source = sys.intern(system_values[EVT_SYSTEM_PROVIDER_NAME][0] or "Unknown")
+            
+            log_entry = {
+                'timestamp': system_values[EVT_SYSTEM_TIME_CREATED][0],
+                'source': source,
+                'source_lower': sys.intern(source.lower()),
+                'event_id': system_values[EVT_SYSTEM_EVENT_ID][0],
+                'message': message,
+                'message_lower': message_lower,
+                'message_norm': message_norm,
+                'raw_data': _decode_raw_data(binary_data),
+                'log_source_name': log_name
+            }
+            logs.append(log_entry)
+            
+            # Stop reading as soon as we have enough results
+            if len(logs) >= max_results:
+                break
+            
+    except ImportError:
+        return logs, PYWIN32_MISSING_MSG
+    except PermissionError:
+        return logs, ACCESS_DENIED_MSG
+    except _pywintypes.error as e:
+        error_code = e.args[0] if e.args else 0
+        if error_code == 5:  # Access denied
+            return logs, ACCESS_DENIED_MSG
+        return logs, f"❌ Windows Error reading {log_name} log: {str(e)}"
+    except Exception as e:
+        return logs, f"❌ Error reading {log_name} Event Log: {str(e)}"
+    
+    return logs, None
 
 
-def read_general_logs(days, game_folder_name, game_root_path):
+def read_general_logs(days, game_folder_name, game_root_path, is_cancelled=None):
     """
     Read BOTH Application and System event logs for any error event
     that mentions the game folder name or path. This is a last-resort
     general search with no Event ID filter.
     
+    Both logs are scanned concurrently, and the newest related events
+    across both are returned.
+    
     Args:
         days: Number of days to look back for events
         game_folder_name: Name of the game's root folder
         game_root_path: Full path to the game's root folder
+        is_cancelled: Optional callable returning True to stop reading early
         
     Returns:
         tuple: (list of log entries, error message or None)
         Each log entry is a dict with keys:
             - timestamp, source, event_id, message, raw_data, log_source_name
+            - source_lower, message_lower, message_norm (as in iter_application_logs)
     """
-    logs = []
-    error_msg = None
     max_results = 10
     
-    # Calculate time threshold
-    time_threshold = datetime.now() - timedelta(days=days)
+    # Error events from the last N days, newest first - the time bound is
+    # applied by the Event Log service so older events are never read
+    query = _build_event_query(days)
     
     # Prepare search terms
     folder_lower = game_folder_name.lower() if game_folder_name else ""
     root_normalized = game_root_path.replace('\\', '/').lower() if game_root_path else ""
     
+    # One regex for all search terms, so each message is scanned once.
+    # Short terms are skipped, they would match unrelated events.
+    needles = []
+    if len(folder_lower) > 3:
+        needles.append(re.escape(folder_lower))
+    if len(root_normalized) > 10:
+        needles.append(re.escape(root_normalized))
+    if not needles:
+        return [], None
+    needle_re = re.compile('|'.join(needles))
+    
     log_names = ["Application", "System"]
     
-    for log_name in log_names:
-        if len(logs) >= max_results:
-            break
+    # Each log has its own handle, so both can be read at the same time
+    with ThreadPoolExecutor(max_workers=len(log_names)) as executor:
+        futures = [
+            executor.submit(
+                _scan_general_log, log_name, query, needle_re, max_results, is_cancelled
+            )
+            for log_name in log_names
+        ]
+        results = [future.result() for future in futures]
+    
+    logs = []
+    error_msg = None
+    for log_logs, log_error in results:
+        logs.extend(log_logs)
+        if log_error and error_msg != ACCESS_DENIED_MSG:
+            error_msg = log_error
+    
+    # Keep the newest related events across both logs
+    logs.sort(key=lambda log: log['timestamp'], reverse=True)
+    
+    return logs[:max_results], error_msg
+
+
+# ============================================================================
+# FUZZY MATCHING
+# ============================================================================
+
+def _difflib_ratio(name, text, min_ratio):
+    """
+    SequenceMatcher ratio with an early exit for clearly different strings.
+    
+    real_quick_ratio() and quick_ratio() are cheap upper bounds of ratio(),
+    so the full computation is skipped when either is below min_ratio.
+    
+    Returns:
+        float: The ratio, or 0.0 if it is below min_ratio
+    """
+    matcher = SequenceMatcher(None, name, text)
+    if matcher.real_quick_ratio() < min_ratio or matcher.quick_ratio() < min_ratio:
+        return 0.0
+    return matcher.ratio()
+
+
+def _can_reach_ratio(name_len, text_len, min_ratio):
+    """
+    Check whether two strings of these lengths can reach min_ratio at all.
+    
+    A ratio is 2 * matches / (total length), and matches can't exceed the
+    shorter length, so 2 * min / (sum) is an upper bound of the ratio.
+    """
+    return 2 * min(name_len, text_len) >= min_ratio * (name_len + text_len)
+
+
+def similarity_ratio(name, text, min_ratio=0.0):
+    """
+    Compute the similarity between a name and a string.
+    
+    Args:
+        name: Lowercased name to compare (e.g. exe name without extension)
+        text: Lowercased string to compare against
+        min_ratio: Ratios below this are reported as 0.0, which lets the
+                   scorer stop early on strings that can't reach it
         
-        try:
-            hand = win32evtlog.OpenEventLog(None, log_name)
-            
-            if not hand:
-                continue
-            
-            try:
-                flags = win32evtlog.EVENTLOG_BACKWARDS_READ | win32evtlog.EVENTLOG_SEQUENTIAL_READ
-                
-                while True:
-                    if len(logs) >= max_results:
-                        break
-                    
-                    events = win32evtlog.ReadEventLog(hand, flags, 0)
-                    
-                    if not events:
-                        break
-                    
-                    past_threshold = False
-                    for event in events:
-                        if len(logs) >= max_results:
-                            break
-                        
-                        # Get event timestamp
-                        event_time = event.TimeGenerated
-                        
-                        # Convert pywintypes.datetime to Python datetime if needed
-                        if hasattr(event_time, 'Format'):
-                            event_time = datetime(
-                                event_time.year,
-                                event_time.month,
-                                event_time.day,
-                                event_time.hour,
-                                event_time.minute,
-                                event_time.second
-                            )
-                        
-                        # Stop if event is older than threshold
-                        if event_time < time_threshold:
-                            past_threshold = True
-                            break
-                        
-                        # Filter by event type (Error only)
-                        event_type = event.EventType
-                        if event_type != win32con.EVENTLOG_ERROR_TYPE:
-                            continue
-                        
-                        # Get Event ID (mask to get actual ID)
-                        event_id = event.EventID & 0xFFFF
-                        
-                        # Extract event message
-                        message = ""
-                        if event.StringInserts:
-                            message = " | ".join([str(s) for s in event.StringInserts if s])
-                        
-                        message_lower = message.lower()
-                        message_normalized = message_lower.replace('\\', '/')
-                        
-                        # Check if message mentions game folder or path
-                        is_related = False
-                        if len(folder_lower) > 3 and folder_lower in message_lower:
-                            is_related = True
-                        elif len(root_normalized) > 10 and root_normalized in message_normalized:
-                            is_related = True
-                        
-                        if not is_related:
-                            continue
-                        
-                        # Get additional data
-                        raw_data = ""
-                        if event.Data:
-                            try:
-                                raw_data = event.Data.decode('utf-8', errors='ignore')
-                            except (UnicodeDecodeError, AttributeError):
-                                raw_data = str(event.Data)
-                        
-                        log_entry = {
-                            'timestamp': event_time,
-                            'source': event.SourceName or "Unknown",
-                            'event_id': event_id,
-                            'message': message,
-                            'raw_data': raw_data,
-                            'log_source_name': log_name
-                        }
-                        logs.append(log_entry)
-                    
-                    if past_threshold:
-                        break
-                        
-            finally:
-                try:
-                    win32evtlog.CloseEventLog(hand)
-                except Exception:
-                    pass  # Handle may already be invalid
-                
-        except PermissionError:
-            error_msg = "❌ Access denied. Please run as Administrator."
-            break
-        except pywintypes.error as e:
-            error_code = e.args[0] if e.args else 0
-            if error_code == 5:  # Access denied
-                error_msg = "❌ Access denied. Please run as Administrator."
-                break
-            else:
-                error_msg = f"❌ Windows Error reading {log_name} log: {str(e)}"
-                continue
-        except Exception as e:
-            error_msg = f"❌ Error reading {log_name} Event Log: {str(e)}"
-            continue
+    Returns:
+        float: The ratio (0.0 - 1.0)
+    """
+    # Strings whose length alone rules out min_ratio are not scored
+    if not _can_reach_ratio(len(name), len(text), min_ratio):
+        return 0.0
     
-    return logs, error_msg
+    if fuzz is not None:
+        return fuzz.ratio(name, text, score_cutoff=min_ratio * 100) / 100.0
+    
+    return _difflib_ratio(name, text, min_ratio)
+
+
+def best_word_ratio(name, words, min_ratio):
+    """
+    Find the best fuzzy match for a name among the words of a message.
+    
+    Args:
+        name: Lowercased name to look for (e.g. exe name without extension)
+        words: Lowercased words of the message
+        min_ratio: Minimum similarity ratio (0.0 - 1.0) to accept
+        
+    Returns:
+        float: Ratio of the matching word, or None if no word matches
+    """
+    # Words whose length is too far off to reach min_ratio are dropped
+    # before scoring. Short words are skipped as well.
+    name_len = len(name)
+    candidates = [
+        word for word in words
+        if len(word) > 3 and _can_reach_ratio(name_len, len(word), min_ratio)
+    ]
+    
+    if process is not None:
+        match = process.extractOne(name, candidates, scorer=fuzz.ratio, score_cutoff=min_ratio * 100)
+        # extractOne keeps scores equal to the cutoff; like the difflib
+        # path, a match must be strictly above min_ratio
+        if match and match[1] > min_ratio * 100:
+            return match[1] / 100.0
+        return None
+    
+    for word in candidates:
+        ratio = _difflib_ratio(name, word, min_ratio)
+        if ratio > min_ratio:
+            return ratio
+    return None
 
 
 # ============================================================================
 # CRASH INTERPRETATION
 # ============================================================================
 
+# Lookup tables derived from CRASH_TRANSLATIONS once at import.
+# Values are indexes into CRASH_TRANSLATIONS so results keep its order.
+# Exception codes are keyed by their integer value ('0xc0000005' -> 0xC0000005)
+_HEX_CODE_INDEX = {
+    int(pattern, 16): index
+    for index, pattern in enumerate(CRASH_TRANSLATIONS)
+    if pattern.startswith('0x')
+}
+# Module and product name patterns, already lowercased
+_NAME_PATTERNS = tuple(
+    (pattern.lower(), index)
+    for index, pattern in enumerate(CRASH_TRANSLATIONS)
+    if not pattern.startswith('0x')
+)
+_TRANSLATION_VALUES = tuple(CRASH_TRANSLATIONS.values())
+
+# Hex exception codes as they appear in a lowercased message
+HEX_CODE_RE = re.compile(r'0x([0-9a-f]{8})')
+
+
+def _build_translation_automaton():
+    """
+    Compile the name patterns into one Aho-Corasick automaton.
+    
+    The automaton finds every pattern in a single pass over the message,
+    instead of one substring search per pattern.
+    
+    Returns:
+        ahocorasick.Automaton mapping each pattern to its index in
+        CRASH_TRANSLATIONS, or None if pyahocorasick is not installed
+    """
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for pattern, index in _NAME_PATTERNS:
+        automaton.add_word(pattern, index)
+    automaton.make_automaton()
+    return automaton
+
+
+_TRANSLATION_AUTOMATON = _build_translation_automaton()
+
+
 def interpret_crash(log_message):
     """
     Interpret crash log message and return user-friendly translations.
@@ -767,22 +1124,385 @@ def interpret_crash(log_message):
     Returns:
         list: List of matching translations, or default message if none found
     """
-    if not log_message:
-        return ["No specific error pattern detected."]
+    return list(interpret_crash_lower(log_message.lower()))
+
+
+@functools.lru_cache(maxsize=512)
+def interpret_crash_lower(message_lower):
+    """
+    Same as interpret_crash, for a message that is already lowercased.
+    
+    Results are cached: repeated crashes of a game usually log the same
+    message over and over.
+    
+    Args:
+        message_lower: The lowercased log message text to analyze
+        
+    Returns:
+        tuple: Matching translations, or default message if none found
+    """
+    if not message_lower:
+        return ("No specific error pattern detected.",)
     
-    message_lower = log_message.lower()
-    translations = []
+    matched = set()
     
-    # Check each pattern against the message
-    for pattern, translation in CRASH_TRANSLATIONS.items():
-        if pattern.lower() in message_lower:
-            translations.append(translation)
+    # Exception codes: one dict lookup per hex code in the message
+    # (the substring check skips the regex scan for messages without codes)
+    if '0x' in message_lower:
+        for code in HEX_CODE_RE.findall(message_lower):
+            index = _HEX_CODE_INDEX.get(int(code, 16))
+            if index is not None:
+                matched.add(index)
+    
+    # Module and product names
+    if _TRANSLATION_AUTOMATON is not None:
+        matched.update(index for _, index in _TRANSLATION_AUTOMATON.iter(message_lower))
+    else:
+        matched.update(index for pattern, index in _NAME_PATTERNS if pattern in message_lower)
+    
+    # Several patterns share a translation (e.g. steam_api / steam_api64),
+    # so report each distinct translation once
+    translations = tuple(dict.fromkeys(_TRANSLATION_VALUES[index] for index in sorted(matched)))
     
     # Return translations found, or default message
     if translations:
         return translations
     else:
-        return ["No specific error pattern detected."]
+        return ("No specific error pattern detected.",)
+
+
+# ============================================================================
+# CRASH SEARCH
+# ============================================================================
+
+def _crash_signature(log):
+    """
+    Build the key used to group repeated crashes of the same kind.
+    
+    Application Error (1000) events are grouped by faulting application,
+    faulting module, exception code and fault offset. Other events are only
+    grouped when their whole message is identical.
+    """
+    if log['event_id'] == 1000:
+        msg_parts = log['message'].split(' | ')
+        if len(msg_parts) > 7:
+            return (1000,) + tuple(sys.intern(msg_parts[idx].strip().lower()) for idx in (0, 3, 6, 7))
+    return (log['event_id'], log['source'], log['message'])
+
+
+@functools.lru_cache(maxsize=32)
+def _derive_search_keys(exe_path):
+    """
+    Derive the names and paths used to match events to an executable.
+    
+    Cached, since the same path is often searched several times in a row
+    (auto-search, then the Search button or a different time period).
+    
+    Args:
+        exe_path: Full path to the .exe file
+        
+    Returns:
+        tuple: (exe_name, exe_name_lower, exe_name_no_ext,
+                game_root_path, game_folder_name,
+                game_folder_lower, game_root_normalized)
+    """
+    exe_name = os.path.basename(exe_path)
+    exe_name_lower = exe_name.lower()
+    exe_name_no_ext = os.path.splitext(exe_name)[0].lower()
+    
+    # Get game root folder for fuzzy matching
+    game_root_path, game_folder_name = get_game_root_folder(exe_path)
+    game_folder_lower = game_folder_name.lower()
+    
+    # Normalize path separators for matching
+    game_root_normalized = game_root_path.replace('\\', '/').lower()
+    
+    return (exe_name, exe_name_lower, exe_name_no_ext,
+            game_root_path, game_folder_name,
+            game_folder_lower, game_root_normalized)
+
+
+def search_crashes(exe_path, days, is_cancelled=None, progress=None):
+    """
+    Search the Windows Event Log for crash events of an executable.
+    
+    Runs on the search worker thread, so it must not touch any widget.
+    
+    Args:
+        exe_path: Full path to the .exe file
+        days: Number of days to look back for events
+        is_cancelled: Optional callable returning True to abort the scan
+        progress: Optional callable receiving status text while searching
+        
+    Returns:
+        str: The formatted crash report
+    """
+    if not exe_path:
+        return "⚠️ Please select an executable file."
+    
+    # Reject UNC / network paths
+    if exe_path.startswith('\\\\') or exe_path.startswith('//'):
+        return "⚠️ Network paths are not supported. Please use a local file."
+    
+    if not os.path.exists(exe_path):
+        return f"❌ File does not exist: {exe_path}"
+    
+    (exe_name, exe_name_lower, exe_name_no_ext,
+     game_root_path, game_folder_name,
+     game_folder_lower, game_root_normalized) = _derive_search_keys(exe_path)
+    
+    # Build header (report pieces are collected in a list and joined once)
+    parts = [
+        REPORT_BANNER,
+        f"📁 File: {exe_name}\n",
+        f"📂 Path: {exe_path}\n",
+        f"🎮 Game Folder: {game_root_path}\n",
+        f"📅 Period: Last {days} days\n\n",
+        REPORT_SEPARATOR,
+    ]
+    
+    # Read event logs, filtering them as they stream in
+    read_progress = None
+    if progress is not None:
+        read_progress = lambda count: progress(f"🔄 Searching... {count} crash events read")
+    read_errors = []
+    logs = iter_application_logs(days, read_errors, is_cancelled, read_progress)
+    
+    # Filter logs matching the executable; only matches are kept
+    matching_logs = []
+    total_logs = 0
+    
+    # Fuzzy scores of each distinct event source against the exe name
+    # (sources repeat across events, so each is scored once)
+    source_ratios = {}
+    
+    for log in logs:
+        total_logs += 1
+        source_lower = log['source_lower']
+        message_lower = log['message_lower']
+        # Message with normalized path separators, for path matching
+        message_normalized = log['message_norm']
+        
+        # Check for exact match in source or message
+        is_match = False
+        match_reason = ""
+        
+        if exe_name_lower in source_lower or exe_name_lower in message_lower:
+            is_match = True
+            match_reason = "exe name match"
+        elif exe_name_no_ext in source_lower or exe_name_no_ext in message_lower:
+            is_match = True
+            match_reason = "exe name (no ext) match"
+        
+        # Fuzzy matching and game folder path matching (auto-fallback)
+        if not is_match:
+            # Check similarity ratio with source (skip for very short names to avoid false positives)
+            if len(exe_name_no_ext) > 4:
+                ratio_source = source_ratios.get(source_lower)
+                if ratio_source is None:
+                    ratio_source = similarity_ratio(exe_name_no_ext, source_lower, 0.6)
+                    source_ratios[source_lower] = ratio_source
+                if ratio_source > 0.6:
+                    is_match = True
+                    match_reason = f"fuzzy match (source: {ratio_source:.0%})"
+            
+            # Check if game folder name appears in message
+            if not is_match and len(game_folder_lower) > 2:
+                if game_folder_lower in message_lower:
+                    is_match = True
+                    match_reason = f"game folder name match ({game_folder_name})"
+            
+            # Check if game root path appears in message
+            if not is_match and len(game_root_normalized) > 10:
+                if game_root_normalized in message_normalized:
+                    is_match = True
+                    match_reason = f"game path match"
+            
+            # Check any word in message matches exe name (skip for very short names)
+            if not is_match and len(exe_name_no_ext) > 4:
+                ratio = best_word_ratio(exe_name_no_ext, message_lower.split(), 0.6)
+                if ratio is not None:
+                    is_match = True
+                    match_reason = f"fuzzy match (word: {ratio:.0%})"
+        
+        # Validate: event must originate from the game's folder
+        # This prevents false positives from other games with similar names
+        # (e.g., Unreal Engine games all end in "-Win64-Shipping.exe")
+        if is_match:
+            event_from_game = False
+            
+            # Check if game root path appears in the message
+            if game_root_normalized in message_normalized:
+                event_from_game = True
+            # Check if game folder name appears in the message (if name is specific enough)
+            elif len(game_folder_lower) > 3 and game_folder_lower in message_lower:
+                event_from_game = True
+            # Check exact exe name in message (same binary name = likely same game)
+            elif exe_name_lower in message_lower:
+                # Also verify the path in the event points to our game folder
+                msg_parts = message_normalized.split(' | ')
+                if len(msg_parts) > 10:
+                    event_app_path = msg_parts[10].strip()
+                    if game_root_normalized in event_app_path:
+                        event_from_game = True
+                    else:
+                        event_from_game = False  # Same exe name, different folder
+                else:
+                    event_from_game = True  # Can't verify path, trust exe name match
+            
+            if not event_from_game:
+                is_match = False
+        
+        if is_match:
+            log['match_reason'] = match_reason
+            # Binary data is only decoded for events that are reported
+            log['raw_data'] = _decode_raw_data(log.pop('binary_data'))
+            matching_logs.append(log)
+    
+    # Check for errors
+    if read_errors:
+        parts.append(f"\n{read_errors[0]}\n")
+        return "".join(parts)
+    
+    if is_cancelled is not None and is_cancelled():
+        return "".join(parts)
+    
+    # Display results
+    if not matching_logs:
+        # Try general search as last resort
+        if progress is not None:
+            progress("🔄 No direct match, searching Application and System logs...")
+        general_logs, general_error = read_general_logs(days, game_folder_name, game_root_path, is_cancelled)
+        if general_error:
+            parts.append(f"\n{general_error}\n")
+        elif general_logs:
+            parts.append(f"\n⚠️ No specific crash events found for the executable.\n")
+            parts.append(f"📂 General search: Found {len(general_logs)} error event(s) related to game folder '{game_folder_name}':\n")
+            parts.append(REPORT_SEPARATOR)
+            
+            for i, log in enumerate(general_logs, 1):
+                timestamp_str = format_event_time(log['timestamp'])
+                parts.append(f"\n📌 Event #{i} [{log['log_source_name']}]\n")
+                parts.append(f"   ⏰ Time: {timestamp_str}\n")
+                parts.append(f"   📋 Source: {log['source']}\n")
+                parts.append(f"   🔢 Event ID: {log['event_id']}\n")
+                
+                # Show message (truncated if needed)
+                message = log['message']
+                if len(message) > 500:
+                    message = message[:500] + "..."
+                if message:
+                    parts.append(f"   💬 Details: {message}\n")
+                
+                # Run interpret_crash on these (message is already lowercased)
+                full_log_text = log['message_lower'] + " " + log['raw_data'].lower()
+                translations = interpret_crash_lower(full_log_text)
+                parts.append(f"   🔍 Translation:\n")
+                parts.extend(f"      ⚠️ {t}\n" for t in translations)
+                
+                parts.append("\n")
+            
+            parts.append(REPORT_SEPARATOR)
+            parts.append(f"📊 Summary: {len(general_logs)} general error(s) found in Application+System logs.\n")
+        else:
+            # Truly nothing found
+            parts.append(f"\n✅ No crash events found for '{exe_name}' in the last {days} days.\n")
+            parts.append(f"   (Searched: exact match → fuzzy match → general folder search)\n")
+            parts.append(f"\n📊 Total crash events scanned: {total_logs}\n")
+    else:
+        # Group repeated crashes (newest occurrence first) so each distinct
+        # crash is formatted and translated only once
+        grouped_logs = {}
+        for log in matching_logs:
+            key = _crash_signature(log)
+            if key in grouped_logs:
+                grouped_logs[key][1] += 1
+            else:
+                grouped_logs[key] = [log, 1]
+        
+        parts.append(f"\n🔴 Found {len(matching_logs)} crash event(s) for '{exe_name}'")
+        if len(grouped_logs) < len(matching_logs):
+            parts.append(f" ({len(grouped_logs)} distinct)")
+        parts.append(":\n")
+        parts.append(REPORT_SEPARATOR)
+        
+        for i, (log, count) in enumerate(grouped_logs.values(), 1):
+            timestamp_str = format_event_time(log['timestamp'])
+            match_reason = log.get('match_reason', 'direct match')
+            repeat_str = f" (x{count})" if count > 1 else ""
+            parts.append(f"\n📌 Event #{i}{repeat_str}\n")
+            parts.append(f"   ⏰ Time: {timestamp_str}\n")
+            parts.append(f"   📋 Source: {log['source']}\n")
+            parts.append(f"   🔢 Event ID: {log['event_id']}\n")
+            parts.append(f"   🎯 Match: {match_reason}\n")
+            
+            # Format message with descriptive labels
+            message = log['message']
+            if len(message) > 800:
+                message = message[:800] + "..."
+            
+            # Parse message parts and assign descriptive labels
+            # Windows Event Log 1000 format:
+            # 0: Faulting application name
+            # 1: Version
+            # 2: Timestamp
+            # 3: Faulting module name
+            # 4: Module version
+            # 5: Module timestamp
+            # 6: Exception code
+            # 7: Fault offset
+            # 8: Faulting process ID
+            # 9: Application start time
+            # 10: Application path
+            # 11: Module path
+            # 12: Report ID
+            
+
+            
+            if message:
+                parts.append(f"   💬 Crash Details:\n")
+                # zip stops after the last labelled field (up to 13 parts)
+                fields = map(str.strip, message.split(' | '))
+                parts.extend(prefix + field + "\n"
+                             for prefix, field in zip(DETAIL_LINE_PREFIXES, fields) if field)
+            
+            if log['raw_data']:
+                if len(log['raw_data']) > 100:
+                    parts.append(f"   📦 Raw Data: {log['raw_data'][:100]}...\n")
+                else:
+                    parts.append(f"   📦 Raw Data: {log['raw_data']}\n")
+            
+            # Get crash interpretation
+            full_log_text = log['message_lower'][:800] + " " + log['raw_data'].lower()
+            translations = interpret_crash_lower(full_log_text)
+            
+            parts.append(f"   🔍 Translation:\n")
+            parts.extend(f"      ⚠️ {translation}\n" for translation in translations)
+            
+            parts.append("\n")
+        
+        parts.append(REPORT_SEPARATOR)
+        parts.append(f"📊 Summary: {len(matching_logs)} crash(es) found out of {total_logs} total error events.\n")
+    
+    return "".join(parts)
+
+
+class SearchWorker(QThread):
+    """Runs search_crashes on a background thread so the window stays responsive."""
+    
+    progress = pyqtSignal(str)
+    result_ready = pyqtSignal(str)
+    
+    def __init__(self, exe_path, days, parent=None):
+        super().__init__(parent)
+        self.exe_path = exe_path
+        self.days = days
+    
+    def run(self):
+        """Run the search and emit the report unless it was cancelled."""
+        result = search_crashes(self.exe_path, self.days, self.isInterruptionRequested, self.progress.emit)
+        if not self.isInterruptionRequested():
+            self.result_ready.emit(result)
 
 
 # ============================================================================
@@ -792,12 +1512,24 @@ def interpret_crash(log_message):
 class CrashDetectiveWindow(QMainWindow):
     """Main window for Crash Detective application."""
     
+    # Window icon, painted on first use and shared by all windows
+    _window_icon = None
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle(f"Crash Detective")
         self.setMinimumSize(700, 600)
         self.resize(750, 650)
         self._last_browse_dir = os.path.dirname(os.path.abspath(__file__))
+        self._search_worker = None
+        self._last_auto_search_path = None
+        self._pending_text = ""
+        
+        # Debounce auto-search so typing a path does not scan on every keystroke
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(AUTO_SEARCH_DELAY_MS)
+        self._debounce.timeout.connect(self._maybe_autosearch)
         
         # Set window icon
         self._set_window_icon()
@@ -844,8 +1576,9 @@ class CrashDetectiveWindow(QMainWindow):
         options_layout.addWidget(period_label)
         
         self.days_combo = QComboBox()
-        self.days_combo.addItems(DAYS_OPTIONS)
-        self.days_combo.setCurrentText("2 days")
+        for label, days in DAYS_OPTIONS:
+            self.days_combo.addItem(label, days)
+        self.days_combo.setCurrentIndex(0)
         options_layout.addWidget(self.days_combo)
         
         options_layout.addStretch()
@@ -870,7 +1603,9 @@ class CrashDetectiveWindow(QMainWindow):
         results_label.setStyleSheet("font-weight: bold;")
         main_layout.addWidget(results_label)
         
-        self.results_text = QTextEdit()
+        # Plain text widget: the report has no rich text, and QPlainTextEdit
+        # lays out large reports much faster than QTextEdit
+        self.results_text = QPlainTextEdit()
         self.results_text.setReadOnly(True)
         self.results_text.setMinimumHeight(250)
         main_layout.addWidget(self.results_text, 1)
@@ -903,10 +1638,36 @@ class CrashDetectiveWindow(QMainWindow):
         return separator
     
     def _set_window_icon(self):
-        """Set the window icon - create a simple magnifying glass icon."""
+        """Set the window icon - the shipped icon.ico or a painted magnifying glass."""
+        icon = self._build_window_icon()
+        if icon is not None:
+            self.setWindowIcon(icon)
+    
+    @classmethod
+    def _build_window_icon(cls):
+        """
+        Load or paint the window icon once and cache it on the class.
+        
+        The shipped icon.ico is used when available, which skips painting.
+        
+        Returns:
+            QIcon, or None to use the default icon if creation fails
+        """
+        if cls._window_icon is not None:
+            return cls._window_icon
+        
+        # PyInstaller extracts bundled data files to sys._MEIPASS
+        base_dir = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+        icon_path = os.path.join(base_dir, ICON_FILENAME)
+        if os.path.exists(icon_path):
+            icon = QIcon(icon_path)
+            if not icon.isNull():
+                cls._window_icon = icon
+                return icon
+        
         try:
             # Create a simple 32x32 pixmap as icon
-            from PyQt6.QtGui import QPainter, QColor, QPen, QBrush
+            from PyQt6.QtGui import QBrush
             from PyQt6.QtCore import QPoint
             
             pixmap = QPixmap(32, 32)
@@ -931,9 +1692,11 @@ class CrashDetectiveWindow(QMainWindow):
             
             painter.end()
             
-            self.setWindowIcon(QIcon(pixmap))
+            cls._window_icon = QIcon(pixmap)
         except Exception:
-            pass  # Use default icon if creation fails
+            return None  # Use default icon if creation fails
+        
+        return cls._window_icon
     
     def _browse_file(self):
         """Open file browser dialog."""
@@ -948,263 +1711,78 @@ class CrashDetectiveWindow(QMainWindow):
             self.exe_path_input.setText(file_path)
     
     def _on_file_changed(self, text):
-        """Handle file path change - auto-search when file is selected."""
-        if text and os.path.exists(text) and text.lower().endswith('.exe'):
-            # Auto-search when a valid exe is selected
-            self._search_crashes()
-    
-    def _search_crashes(self):
-        """Perform crash search."""
-        self.results_text.setText("🔄 Searching...")
-        QApplication.processEvents()
-        
-        result = self._handle_search()
-        self.results_text.setText(result)
+        """Handle file path change - schedule an auto-search once editing pauses."""
+        self._pending_text = text
+        self._debounce.start()
     
-    def _handle_search(self):
-        """
-        Handler for the search event.
-        Reads Windows Event Log and searches for crash events.
-        """
-        exe_path = self.exe_path_input.text()
-        days_str = self.days_combo.currentText()
-        
-        days = DAYS_MAP.get(days_str, 2)
-        
-        if not exe_path:
-            return "⚠️ Please select an executable file."
+    def _maybe_autosearch(self):
+        """Auto-search when the path has settled on an existing .exe file."""
+        text = self._pending_text
         
-        # Reject UNC / network paths
-        if exe_path.startswith('\\\\') or exe_path.startswith('//'):
-            return "⚠️ Network paths are not supported. Please use a local file."
-        
-        if not os.path.exists(exe_path):
-            return f"❌ File does not exist: {exe_path}"
-        
-        exe_name = os.path.basename(exe_path)
-        exe_name_lower = exe_name.lower()
-        exe_name_no_ext = os.path.splitext(exe_name)[0].lower()
-        
-        # Get game root folder for fuzzy matching
-        game_root_path, game_folder_name = get_game_root_folder(exe_path)
-        game_folder_lower = game_folder_name.lower()
+        # Cheap string checks first: os.path.exists can be slow
+        # (e.g. on disconnected drives)
+        if not text or not text.lower().endswith('.exe'):
+            return
         
-        # Normalize path separators for matching
-        game_root_normalized = game_root_path.replace('\\', '/').lower()
+        # Skip paths that were already checked and searched automatically
+        if text == self._last_auto_search_path:
+            return
         
-        # Build header
-        result = f"""╔══════════════════════════════════════════════════════════════╗
-║                    CRASH DETECTIVE                              ║
-╚══════════════════════════════════════════════════════════════╝
-
-📁 File: {exe_name}
-📂 Path: {exe_path}
-🎮 Game Folder: {game_root_path}
-📅 Period: Last {days} days
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
+        if os.path.exists(text):
+            # Auto-search when a valid exe is selected
+            self._last_auto_search_path = text
+            self._search_crashes()
+    
+    def _search_crashes(self):
+        """Start a crash search on a background thread."""
+        # A new search supersedes any search still running
+        self._cancel_search()
         
-        # Read event logs
-        logs, error_msg = read_application_logs(days)
+        self.results_text.setPlainText("🔄 Searching...")
         
-        # Check for errors
-        if error_msg:
-            result += f"\n{error_msg}\n"
-            return result
+        exe_path = self.exe_path_input.text()
+        days = self.days_combo.currentData()
         
-        # Filter logs matching the executable
-        matching_logs = []
+        worker = SearchWorker(exe_path, days, self)
+        worker.progress.connect(lambda text: self._show_search_text(worker, text))
+        worker.result_ready.connect(lambda text: self._show_search_text(worker, text))
+        worker.finished.connect(lambda: self._on_search_finished(worker))
+        self._search_worker = worker
         
-        for log in logs:
-            source_lower = log['source'].lower()
-            message_lower = log['message'].lower()
-            # Normalize path separators in message for path matching
-            message_normalized = message_lower.replace('\\', '/')
-            
-            # Check for exact match in source or message
-            is_match = False
-            match_reason = ""
-            
-            if exe_name_lower in source_lower or exe_name_lower in message_lower:
-                is_match = True
-                match_reason = "exe name match"
-            elif exe_name_no_ext in source_lower or exe_name_no_ext in message_lower:
-                is_match = True
-                match_reason = "exe name (no ext) match"
-            
-            # Fuzzy matching and game folder path matching (auto-fallback)
-            if not is_match:
-                # Check similarity ratio with source (skip for very short names to avoid false positives)
-                if len(exe_name_no_ext) > 4:
-                    ratio_source = SequenceMatcher(None, exe_name_no_ext, source_lower).ratio()
-                    if ratio_source > 0.6:
-                        is_match = True
-                        match_reason = f"fuzzy match (source: {ratio_source:.0%})"
-                
-                # Check if game folder name appears in message
-                if not is_match and len(game_folder_lower) > 2:
-                    if game_folder_lower in message_lower:
-                        is_match = True
-                        match_reason = f"game folder name match ({game_folder_name})"
-                
-                # Check if game root path appears in message
-                if not is_match and len(game_root_normalized) > 10:
-                    if game_root_normalized in message_normalized:
-                        is_match = True
-                        match_reason = f"game path match"
-                
-                # Check any word in message matches exe name (skip for very short names)
-                if not is_match and len(exe_name_no_ext) > 4:
-                    words = message_lower.split()
-                    for word in words:
-                        if len(word) > 3:  # Skip short words
-                            ratio = SequenceMatcher(None, exe_name_no_ext, word).ratio()
-                            if ratio > 0.6:
-                                is_match = True
-                                match_reason = f"fuzzy match (word: {ratio:.0%})"
-                                break
-            
-            # Validate: event must originate from the game's folder
-            # This prevents false positives from other games with similar names
-            # (e.g., Unreal Engine games all end in "-Win64-Shipping.exe")
-            if is_match:
-                event_from_game = False
-                
-                # Check if game root path appears in the message
-                if game_root_normalized in message_normalized:
-                    event_from_game = True
-                # Check if game folder name appears in the message (if name is specific enough)
-                elif len(game_folder_lower) > 3 and game_folder_lower in message_lower:
-                    event_from_game = True
-                # Check exact exe name in message (same binary name = likely same game)
-                elif exe_name_lower in message_lower:
-                    # Also verify the path in the event points to our game folder
-                    msg_parts = log['message'].split(' | ')
-                    if len(msg_parts) > 10:
-                        event_app_path = msg_parts[10].strip().replace('\\', '/').lower()
-                        if game_root_normalized in event_app_path:
-                            event_from_game = True
-                        else:
-                            event_from_game = False  # Same exe name, different folder
-                    else:
-                        event_from_game = True  # Can't verify path, trust exe name match
-                
-                if not event_from_game:
-                    is_match = False
-            
-            if is_match:
-                log['match_reason'] = match_reason
-                matching_logs.append(log)
-        
-        # Display results
-        if not matching_logs:
-            # Try general search as last resort
-            general_logs, general_error = read_general_logs(days, game_folder_name, game_root_path)
-            if general_error:
-                result += f"\n{general_error}\n"
-            elif general_logs:
-                result += f"\n⚠️ No specific crash events found for the executable.\n"
-                result += f"📂 General search: Found {len(general_logs)} error event(s) related to game folder '{game_folder_name}':\n"
-                result += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-                
-                for i, log in enumerate(general_logs, 1):
-                    timestamp_str = log['timestamp'].strftime('%Y-%m-%d %H:%M:%S')
-                    result += f"\n📌 Event #{i} [{log['log_source_name']}]\n"
-                    result += f"   ⏰ Time: {timestamp_str}\n"
-                    result += f"   📋 Source: {log['source']}\n"
-                    result += f"   🔢 Event ID: {log['event_id']}\n"
-                    
-                    # Show message (truncated if needed)
-                    message = log['message']
-                    if len(message) > 500:
-                        message = message[:500] + "..."
-                    if message:
-                        result += f"   💬 Details: {message}\n"
-                    
-                    # Run interpret_crash on these
-                    full_log_text = log['message'] + " " + log.get('raw_data', '')
-                    translations = interpret_crash(full_log_text)
-                    result += f"   🔍 Translation:\n"
-                    for t in translations:
-                        result += f"      ⚠️ {t}\n"
-                    
-                    result += "\n"
-                
-                result += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-                result += f"📊 Summary: {len(general_logs)} general error(s) found in Application+System logs.\n"
-            else:
-                # Truly nothing found
-                result += f"\n✅ No crash events found for '{exe_name}' in the last {days} days.\n"
-                result += f"   (Searched: exact match → fuzzy match → general folder search)\n"
-                result += f"\n📊 Total crash events scanned: {len(logs)}\n"
-        else:
-            result += f"\n🔴 Found {len(matching_logs)} crash event(s) for '{exe_name}':\n"
-            result += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-            
-            for i, log in enumerate(matching_logs, 1):
-                timestamp_str = log['timestamp'].strftime('%Y-%m-%d %H:%M:%S')
-                match_reason = log.get('match_reason', 'direct match')
-                result += f"\n📌 Event #{i}\n"
-                result += f"   ⏰ Time: {timestamp_str}\n"
-                result += f"   📋 Source: {log['source']}\n"
-                result += f"   🔢 Event ID: {log['event_id']}\n"
-                result += f"   🎯 Match: {match_reason}\n"
-                
-                # Format message with descriptive labels
-                message = log['message']
-                if len(message) > 800:
-                    message = message[:800] + "..."
-                
-                # Parse message parts and assign descriptive labels
-                # Windows Event Log 1000 format:
-                # 0: Faulting application name
-                # 1: Version
-                # 2: Timestamp
-                # 3: Faulting module name
-                # 4: Module version
-                # 5: Module timestamp
-                # 6: Exception code
-                # 7: Fault offset
-                # 8: Faulting process ID
-                # 9: Application start time
-                # 10: Application path
-                # 11: Module path
-                # 12: Report ID
-                
-
-                
-                if message:
-                    result += f"   💬 Crash Details:\n"
-                    msg_parts = message.split(' | ')
-                    for idx, part in enumerate(msg_parts[:13]):  # Up to 13 parts
-                        if part.strip():
-                            label = DETAIL_LABELS[idx] if idx < len(DETAIL_LABELS) else f"Field {idx}"
-                            result += f"      • {label}: {part.strip()}\n"
-                
-                if log['raw_data']:
-                    result += f"   📦 Raw Data: {log['raw_data'][:100]}...\n" if len(log['raw_data']) > 100 else f"   📦 Raw Data: {log['raw_data']}\n"
-                
-                # Get crash interpretation
-                full_log_text = message + " " + log.get('raw_data', '')
-                translations = interpret_crash(full_log_text)
-                
-                result += f"   🔍 Translation:\n"
-                for translation in translations:
-                    result += f"      ⚠️ {translation}\n"
-                
-                result += "\n"
-            
-            result += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-            result += f"📊 Summary: {len(matching_logs)} crash(es) found out of {len(logs)} total error events.\n"
-        
-        return result
+        # Prevent stacking searches from repeated clicks while one is running
+        self.search_btn.setEnabled(False)
+        worker.start()
+    
+    def _show_search_text(self, worker, text):
+        """Show progress or results, ignoring late signals from superseded searches."""
+        if self._search_worker is worker:
+            self.results_text.setPlainText(text)
+    
+    def _cancel_search(self):
+        """Ask the running search (if any) to stop."""
+        if self._search_worker is not None:
+            self._search_worker.requestInterruption()
+    
+    def _on_search_finished(self, worker):
+        """Release a search worker once its thread has finished."""
+        if self._search_worker is worker:
+            self._search_worker = None
+            self.search_btn.setEnabled(True)
+        worker.deleteLater()
+    
+    def closeEvent(self, event):
+        """Stop any running searches before the window is destroyed."""
+        self._debounce.stop()
+        for worker in self.findChildren(SearchWorker):
+            worker.requestInterruption()
+            worker.wait()
+        super().closeEvent(event)
     
     def _copy_to_clipboard(self):
         """Copy results to clipboard."""
         results_text = self.results_text.toPlainText()
         
-        if not results_text or results_text.strip() == '':
+        if not results_text or results_text.isspace():
             QMessageBox.warning(self, "Warning", "⚠️ No results to copy")
             return
         